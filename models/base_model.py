@@ -32,6 +32,16 @@ class BaseModel:
 
     """
 
+    _cls_name = "[BaseModel]"
+
+    def __init_subclass__(cls, **kwargs):
+        """
+        Caches the bracketed class name used by __str__ on each subclass.
+
+        """
+        super().__init_subclass__(**kwargs)
+        cls._cls_name = f"[{cls.__name__}]"
+
     def __init__(self, *args, **kwargs):
         """
         Initializes a new instance of the BaseModel class.
@@ -40,20 +50,33 @@ class BaseModel:
         representation. Otherwise, it creates a new instance with a new id
         and created_at.
 
+        created_at and updated_at may be any naive ISO 8601 string accepted
+        by datetime.fromisoformat (including date-only strings), or the
+        '%Y-%m-%dT%H:%M:%S.%f' format.
+
         Args:
             *args: Not used.
             **kwargs: A dictionary representing the instance attributes.
 
+        Raises:
+            ValueError: If created_at or updated_at cannot be parsed or
+            carries a timezone offset.
+
         """
         if kwargs:
             if 'id' not in kwargs:
                 kwargs['id'] = str(uuid.uuid4())
-            if 'created_at' in kwargs:
-                kwargs['created_at'] = datetime.strptime(
-                    kwargs['created_at'], '%Y-%m-%dT%H:%M:%S.%f')
-            if 'updated_at' in kwargs:
-                kwargs['updated_at'] = datetime.strptime(
-                    kwargs['updated_at'], '%Y-%m-%dT%H:%M:%S.%f')
+            for key in ('created_at', 'updated_at'):
+                if key in kwargs:
+                    try:
+                        value = datetime.fromisoformat(kwargs[key])
+                    except ValueError:
+                        value = datetime.strptime(
+                            kwargs[key], '%Y-%m-%dT%H:%M:%S.%f')
+                    if value.tzinfo is not None:
+                        raise ValueError(
+                            f"{key} must be a naive datetime: {kwargs[key]}")
+                    kwargs[key] = value
             for key, value in kwargs.items():
                 if key != '__class__':
                     setattr(self, key, value)
@@ -73,7 +96,7 @@ class BaseModel:
             str: A string representation of the BaseModel instance.
 
         """
-        return f"[{self.__class__.__name__}] ({self.id}) {self.__dict__}"
+        return f"{self._cls_name} ({self.id}) {self.__dict__}"
 
     def save(self):
         """
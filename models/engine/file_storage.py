@@ -6,11 +6,38 @@ This module defines the FileStorage class, which is responsible for
 serializing instances to a JSON file and deserializing JSON file to
 instances.
 
+orjson is used for (de)serialization when it is installed, falling back
+to the standard library json module otherwise, and for data orjson cannot
+represent exactly (integers outside the 64-bit range, NaN and infinity).
+
 """
 
 import json
+import math
+import re
 from os.path import exists
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _all_finite(value):
+    """
+    Returns False if value holds a NaN or infinite float at any depth.
+
+    orjson writes these as null, while json keeps them.
+
+    """
+    if isinstance(value, float):
+        return math.isfinite(value)
+    if isinstance(value, dict):
+        return all(_all_finite(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return all(_all_finite(item) for item in value)
+    return True
+
 
 class FileStorage:
     """
@@ -61,8 +88,16 @@ class FileStorage:
         serialized_objects = {
             key: value.to_dict() for key, value in self.__objects.items()
         }
-        with open(self.__file_path, "w") as file:
-            json.dump(serialized_objects, file)
+        data = None
+        if orjson is not None and _all_finite(serialized_objects):
+            try:
+                data = orjson.dumps(serialized_objects)
+            except TypeError:
+                pass
+        if data is None:
+            data = json.dumps(serialized_objects).encode()
+        with open(self.__file_path, "wb") as file:
+            file.write(data)
 
     def reload(self):
         """deserializes the JSON file to __objects"""
@@ -75,8 +110,17 @@ class FileStorage:
         from models.review import Review
 
         if exists(self.__file_path):
-            with open(self.__file_path) as jsonfile:
-                decereal = json.load(jsonfile)
+            with open(self.__file_path, "rb") as jsonfile:
+                data = jsonfile.read()
+            decereal = None
+            # orjson reads integers outside the 64-bit range as floats
+            if orjson is not None and not re.search(rb"\d{19,}", data):
+                try:
+                    decereal = orjson.loads(data)
+                except orjson.JSONDecodeError:
+                    pass
+            if decereal is None:
+                decereal = json.loads(data)
             for keys in decereal.keys():
                 if decereal[keys]['__class__'] == "BaseModel":
                     self.__objects[keys] = BaseModel(**decereal[keys])
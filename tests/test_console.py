@@ -85,6 +85,27 @@ class TestHBNBCommand(unittest.TestCase):
             self.console.onecmd(f"show BaseModel {obj_id}")
             self.assertTrue("test" in output.getvalue().strip())
 
+    def test_update_common_attributes(self):
+        """
+        Test that the update command sets id, created_at and updated_at
+        as plain strings.
+        """
+        with patch('sys.stdout', new=StringIO()) as output:
+            self.console.onecmd("create BaseModel")
+            obj_id = output.getvalue().strip()
+
+        key = f"BaseModel.{obj_id}"
+        obj = storage.all()[key]
+        try:
+            with patch('sys.stdout', new=StringIO()), \
+                    patch.object(storage, "save"):
+                for attr in ("created_at", "updated_at", "id"):
+                    self.console.onecmd(f"update BaseModel {obj_id} "
+                                        f"{attr} 'value'")
+                    self.assertEqual(getattr(obj, attr), "value")
+        finally:
+            del storage.all()[key]
+
     def test_count(self):
         """
         Test the count command.
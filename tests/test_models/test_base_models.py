@@ -7,14 +7,40 @@ This module contains the unit tests for the BaseModel class. It includes
 test cases to ensure proper instantiation, attribute assignment, method behavior,
 and serialization/deserialization functionality of the BaseModel class.
 
+TestBaseModelInstantiation and TestBaseModelToDict only work in memory.
+TestBaseModelSave writes to disk through storage: its setUpClass points
+the shared models.storage singleton at a private temporary file, and only
+tearDownClass restores the default path, so every save made while the
+class runs goes to that temporary file.
+
 """
 
+import mmap
 import os
+import shutil
+import tempfile
 import unittest
 from datetime import datetime
-from time import sleep
+from itertools import count
+from unittest.mock import MagicMock, patch
+from models import storage
 from models.base_model import BaseModel
-import models
+
+DT = datetime(2024, 1, 1, 12, 0, 0, 123456)
+DT_ISO = DT.isoformat()
+
+
+def ticking_clock():
+    """
+    Patch the datetime used by BaseModel so that every call to now()
+    returns a strictly later timestamp, without waiting on the real clock.
+    """
+    ticks = count()
+    mock_datetime = MagicMock()
+    mock_datetime.now.side_effect = (
+        lambda: datetime(2024, 1, 1, 0, 0, 0, next(ticks))
+    )
+    return patch("models.base_model.datetime", mock_datetime)
 
 
 class TestBaseModelInstantiation(unittest.TestCase):
@@ -22,6 +48,17 @@ class TestBaseModelInstantiation(unittest.TestCase):
     Test suite for testing instantiation of the BaseModel class.
     """
 
+    @classmethod
+    def setUpClass(cls):
+        """
+        Create one read-only BaseModel instance shared by the tests that
+        only inspect its attributes, and a pair created in order on a
+        ticking clock for the tests that compare two instances.
+        """
+        cls.bm = BaseModel()
+        with ticking_clock():
+            cls.bm_a, cls.bm_b = BaseModel(), BaseModel()
+
     def test_no_args_instantiates(self):
         """
         Test that a BaseModel instance is created with no arguments.
@@ -32,71 +69,63 @@ class TestBaseModelInstantiation(unittest.TestCase):
         """
         Test that a new BaseModel instance is stored in the objects dictionary.
         """
-        self.assertIn(BaseModel(), models.storage.all().values())
-
-    def test_id_is_public_str(self):
-        """
-        Test that the 'id' attribute of a BaseModel instance is a public
-        string.
-        """
-        self.assertEqual(str, type(BaseModel().id))
-
-    def test_created_at_is_public_datetime(self):
-        """
-        Test that the 'created_at' attribute of a BaseModel instance is a
-        public datetime object.
-        """
-        self.assertEqual(datetime, type(BaseModel().created_at))
+        bm = BaseModel()
+        self.assertIn(f"BaseModel.{bm.id}", storage.all())
 
-    def test_updated_at_is_public_datetime(self):
+    def test_public_attribute_types(self):
         """
-        Test that the 'updated_at' attribute of a BaseModel instance is a
-        public datetime object.
+        Test that 'id' is a public string and that 'created_at' and
+        'updated_at' are public datetime objects.
         """
-        self.assertEqual(datetime, type(BaseModel().updated_at))
+        for attr, expected_type in (("id", str),
+                                    ("created_at", datetime),
+                                    ("updated_at", datetime)):
+            with self.subTest(attr=attr):
+                self.assertEqual(expected_type, type(getattr(self.bm, attr)))
 
     def test_two_models_unique_ids(self):
         """
         Test that two BaseModel instances have unique ids.
         """
-        bm1 = BaseModel()
-        bm2 = BaseModel()
-        self.assertNotEqual(bm1.id, bm2.id)
+        self.assertNotEqual(self.bm_a.id, self.bm_b.id)
 
     def test_two_models_different_created_at(self):
         """
         Test that two BaseModel instances have different 'created_at'
         datetime values.
         """
-        bm1 = BaseModel()
-        sleep(0.05)
-        bm2 = BaseModel()
-        self.assertLess(bm1.created_at, bm2.created_at)
+        self.assertLess(self.bm_a.created_at, self.bm_b.created_at)
 
     def test_two_models_different_updated_at(self):
         """
         Test that two BaseModel instances have different 'updated_at'
         datetime values.
         """
-        bm1 = BaseModel()
-        sleep(0.05)
-        bm2 = BaseModel()
-        self.assertLess(bm1.updated_at, bm2.updated_at)
+        self.assertLess(self.bm_a.updated_at, self.bm_b.updated_at)
 
     def test_str_representation(self):
         """
         Test the string representation of a BaseModel instance.
         """
-        dt = datetime.today()
-        dt_repr = repr(dt)
+        dt_repr = repr(DT)
         bm = BaseModel()
         bm.id = "123456"
-        bm.created_at = bm.updated_at = dt
+        bm.created_at = bm.updated_at = DT
         bmstr = bm.__str__()
-        self.assertIn("[BaseModel] (123456)", bmstr)
-        self.assertIn("'id': '123456'", bmstr)
-        self.assertIn("'created_at': " + dt_repr, bmstr)
-        self.assertIn("'updated_at': " + dt_repr, bmstr)
+        expected = ("[BaseModel] (123456)",
+                    "'id': '123456'",
+                    f"'created_at': {dt_repr}",
+                    f"'updated_at': {dt_repr}")
+        for fragment in expected:
+            self.assertIn(fragment, bmstr)
+
+    def test_str_format(self):
+        """
+        Test that the string representation is the bracketed class name,
+        the id in parentheses and the instance __dict__.
+        """
+        bm = BaseModel()
+        self.assertEqual(str(bm), f"[BaseModel] ({bm.id}) {bm.__dict__}")
 
     def test_args_unused(self):
         """
@@ -109,12 +138,45 @@ class TestBaseModelInstantiation(unittest.TestCase):
         """
         Test instantiation of a BaseModel instance with keyword arguments.
         """
-        dt = datetime.today()
-        dt_iso = dt.isoformat()
-        bm = BaseModel(id="345", created_at=dt_iso, updated_at=dt_iso)
+        bm = BaseModel(id="345", created_at=DT_ISO, updated_at=DT_ISO)
         self.assertEqual(bm.id, "345")
-        self.assertEqual(bm.created_at, dt)
-        self.assertEqual(bm.updated_at, dt)
+        self.assertEqual(bm.created_at, DT)
+        self.assertEqual(bm.updated_at, DT)
+
+    def test_instantiation_with_strptime_format_kwargs(self):
+        """
+        Test instantiation with timestamps that only the strptime fallback
+        accepts.
+        """
+        bm = BaseModel(id="345", created_at="2024-1-1T12:0:0.123456",
+                       updated_at="2024-1-1T12:0:0.123456")
+        self.assertEqual(bm.created_at, DT)
+        self.assertEqual(bm.updated_at, DT)
+
+    def test_instantiation_with_date_only_kwargs(self):
+        """
+        Test instantiation with date-only timestamps.
+        """
+        bm = BaseModel(id="345", created_at="2024-01-01",
+                       updated_at="2024-01-01")
+        self.assertEqual(bm.created_at, datetime(2024, 1, 1))
+        self.assertEqual(bm.updated_at, datetime(2024, 1, 1))
+
+    def test_instantiation_with_aware_kwargs(self):
+        """
+        Test that timestamps with a timezone offset are rejected.
+        """
+        for key in ("created_at", "updated_at"):
+            with self.subTest(key=key):
+                with self.assertRaises(ValueError):
+                    BaseModel(id="345", **{key: "2024-01-01T00:00:00+02:00"})
+
+    def test_instantiation_with_invalid_kwargs(self):
+        """
+        Test that timestamps neither parser accepts are rejected.
+        """
+        with self.assertRaises(ValueError):
+            BaseModel(id="345", created_at="not a date")
 
     def test_instantiation_with_None_kwargs(self):
         """
@@ -129,12 +191,10 @@ class TestBaseModelInstantiation(unittest.TestCase):
         Test instantiation of a BaseModel instance with positional and
         keyword arguments.
         """
-        dt = datetime.today()
-        dt_iso = dt.isoformat()
-        bm = BaseModel("12", id="345", created_at=dt_iso, updated_at=dt_iso)
+        bm = BaseModel("12", id="345", created_at=DT_ISO, updated_at=DT_ISO)
         self.assertEqual(bm.id, "345")
-        self.assertEqual(bm.created_at, dt)
-        self.assertEqual(bm.updated_at, dt)
+        self.assertEqual(bm.created_at, DT)
+        self.assertEqual(bm.updated_at, DT)
 
 
 class TestBaseModelSave(unittest.TestCase):
@@ -143,46 +203,47 @@ class TestBaseModelSave(unittest.TestCase):
     """
 
     @classmethod
-    def setUp(self):
-        try:
-            os.rename("file.json", "tmp")
-        except IOError:
-            pass
+    def setUpClass(cls):
+        """
+        Point storage at a file in a private temporary directory so the
+        tests never touch the repository's file.json.
+        """
+        cls._tmp = tempfile.mkdtemp()
+        cls.file_path = os.path.join(cls._tmp, "file.json")
+        storage._FileStorage__file_path = cls.file_path
 
     @classmethod
-    def tearDown(self):
-        try:
-            os.remove("file.json")
-        except IOError:
-            pass
-        try:
-            os.rename("tmp", "file.json")
-        except IOError:
-            pass
+    def tearDownClass(cls):
+        """
+        Restore the default storage path and remove the temporary directory.
+        """
+        del storage._FileStorage__file_path
+        shutil.rmtree(cls._tmp)
 
     def test_one_save(self):
         """
         Test saving a BaseModel instance once.
         """
-        bm = BaseModel()
-        sleep(0.05)
-        first_updated_at = bm.updated_at
-        bm.save()
+        with ticking_clock(), patch.object(storage, "save") as save_spy:
+            bm = BaseModel()
+            first_updated_at = bm.updated_at
+            bm.save()
         self.assertLess(first_updated_at, bm.updated_at)
+        save_spy.assert_called_once_with()
 
     def test_two_saves(self):
         """
         Test saving a BaseModel instance multiple times.
         """
-        bm = BaseModel()
-        sleep(0.05)
-        first_updated_at = bm.updated_at
-        bm.save()
-        second_updated_at = bm.updated_at
-        self.assertLess(first_updated_at, second_updated_at)
-        sleep(0.05)
-        bm.save()
+        with ticking_clock(), patch.object(storage, "save") as save_spy:
+            bm = BaseModel()
+            first_updated_at = bm.updated_at
+            bm.save()
+            second_updated_at = bm.updated_at
+            self.assertLess(first_updated_at, second_updated_at)
+            bm.save()
         self.assertLess(second_updated_at, bm.updated_at)
+        self.assertEqual(save_spy.call_count, 2)
 
     def test_save_with_arg(self):
         """
@@ -199,8 +260,10 @@ class TestBaseModelSave(unittest.TestCase):
         bm = BaseModel()
         bm.save()
         bmid = "BaseModel." + bm.id
-        with open("file.json", "r") as f:
-            self.assertIn(bmid, f.read())
+        with open(self.file_path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                self.assertNotEqual(mm.find(bmid.encode()), -1,
+                                    f"{bmid} not found in {self.file_path}")
 
 
 class TestBaseModelToDict(unittest.TestCase):
@@ -208,23 +271,29 @@ class TestBaseModelToDict(unittest.TestCase):
     Test suite for testing the to_dict method of the BaseModel class.
     """
 
+    @classmethod
+    def setUpClass(cls):
+        """
+        Create one read-only BaseModel instance shared by the tests that
+        only inspect its dictionary representation.
+        """
+        cls.bm = BaseModel()
+
     def test_to_dict_type(self):
         """
         Test the type of the returned dictionary from to_dict method.
         """
-        bm = BaseModel()
-        self.assertTrue(dict, type(bm.to_dict()))
+        self.assertIsInstance(self.bm.to_dict(), dict)
 
     def test_to_dict_contains_correct_keys(self):
         """
         Test that the returned dictionary from to_dict method contains
         the correct keys.
         """
-        bm = BaseModel()
-        self.assertIn("id", bm.to_dict())
-        self.assertIn("created_at", bm.to_dict())
-        self.assertIn("updated_at", bm.to_dict())
-        self.assertIn("__class__", bm.to_dict())
+        bm_dict = self.bm.to_dict()
+        for key in ("id", "created_at", "updated_at", "__class__"):
+            with self.subTest(key=key):
+                self.assertIn(key, bm_dict)
 
     def test_to_dict_contains_added_attributes(self):
         """
@@ -234,16 +303,16 @@ class TestBaseModelToDict(unittest.TestCase):
         bm = BaseModel()
         bm.name = "Holberton"
         bm.my_number = 98
-        self.assertIn("name", bm.to_dict())
-        self.assertIn("my_number", bm.to_dict())
+        bm_dict = bm.to_dict()
+        self.assertIn("name", bm_dict)
+        self.assertIn("my_number", bm_dict)
 
     def test_to_dict_datetime_attributes_are_strs(self):
         """
         Test that the datetime attributes in the returned dictionary from
         to_dict method are strings.
         """
-        bm = BaseModel()
-        bm_dict = bm.to_dict()
+        bm_dict = self.bm.to_dict()
         self.assertEqual(str, type(bm_dict["created_at"]))
         self.assertEqual(str, type(bm_dict["updated_at"]))
 
@@ -251,32 +320,43 @@ class TestBaseModelToDict(unittest.TestCase):
         """
         Test the output of the to_dict method.
         """
-        dt = datetime.today()
         bm = BaseModel()
         bm.id = "123456"
-        bm.created_at = bm.updated_at = dt
+        bm.created_at = bm.updated_at = DT
         tdict = {
             'id': '123456',
             '__class__': 'BaseModel',
-            'created_at': dt.isoformat(),
-            'updated_at': dt.isoformat()
+            'created_at': DT_ISO,
+            'updated_at': DT_ISO
         }
-        self.assertDictEqual(bm.to_dict(), tdict)
+        result = bm.to_dict()
+        self.assertEqual(result, tdict)
 
     def test_contrast_to_dict_dunder_dict(self):
         """
         Test the contrast between to_dict method and __dict__ attribute.
         """
+        self.assertNotEqual(self.bm.to_dict(), self.bm.__dict__)
+
+    def test_added_attributes_round_trip(self):
+        """
+        Test that added attributes survive to_dict method and recreating
+        an instance from its dictionary.
+        """
         bm = BaseModel()
-        self.assertNotEqual(bm.to_dict(), bm.__dict__)
+        bm.name = "Holberton"
+        bm.my_number = 98
+        new_bm = BaseModel(**bm.to_dict())
+        self.assertEqual(new_bm.name, "Holberton")
+        self.assertEqual(new_bm.my_number, 98)
+        self.assertEqual(new_bm.to_dict(), bm.to_dict())
 
     def test_to_dict_with_arg(self):
         """
         Test calling to_dict method with an argument.
         """
-        bm = BaseModel()
         with self.assertRaises(TypeError):
-            bm.to_dict(None)
+            self.bm.to_dict(None)
 
 
 if __name__ == "__main__":
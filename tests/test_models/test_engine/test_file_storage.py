@@ -5,9 +5,12 @@ Module containing unit tests for the FileStorage class.
 
 """
 
+import math
 import unittest
 import os
 from datetime import datetime
+from unittest.mock import patch
+from models.engine import file_storage
 from models.engine.file_storage import FileStorage
 from models.base_model import BaseModel
 
@@ -92,6 +95,74 @@ class FileStorageTestCase(unittest.TestCase):
         self.assertEqual(objects[key].created_at, model.created_at)
         self.assertEqual(objects[key].updated_at, model.updated_at)
 
+    def round_trip(self, **attrs):
+        """
+        Save a BaseModel carrying attrs as the only stored object, reload
+        storage from the file and return the reloaded instance.
+
+        """
+        storage = FileStorage()
+        with patch.object(FileStorage, "_FileStorage__objects", {}):
+            model = BaseModel()
+            for name, value in attrs.items():
+                setattr(model, name, value)
+            storage.save()
+            storage._FileStorage__objects = {}
+            storage.reload()
+        return storage.all()[f"BaseModel.{model.id}"]
+
+    @unittest.skipIf(file_storage.orjson is None, "orjson is not installed")
+    def test_save_reload_orjson(self):
+        """
+        Test a save/reload round trip through orjson, including an integer
+        wider than 64 bits that orjson cannot encode.
+
+        """
+        reloaded = self.round_trip(name="Holberton", my_number=98)
+        self.assertEqual(reloaded.name, "Holberton")
+        self.assertEqual(reloaded.my_number, 98)
+
+        reloaded = self.round_trip(my_number=10**20)
+        self.assertEqual(reloaded.my_number, 10**20)
+        self.assertIs(type(reloaded.my_number), int)
+
+    @unittest.skipIf(file_storage.orjson is None, "orjson is not installed")
+    def test_save_reload_orjson_negative_int(self):
+        """
+        Test a save/reload round trip of a 19-digit integer below the
+        signed 64-bit range.
+
+        """
+        reloaded = self.round_trip(my_number=-2**63 - 1)
+        self.assertEqual(reloaded.my_number, -2**63 - 1)
+        self.assertIs(type(reloaded.my_number), int)
+
+    @unittest.skipIf(file_storage.orjson is None, "orjson is not installed")
+    def test_save_reload_orjson_non_finite(self):
+        """
+        Test that NaN and infinity survive a save/reload round trip
+        instead of being written as null by orjson.
+
+        """
+        reloaded = self.round_trip(latitude=float("nan"),
+                                   longitude=float("inf"),
+                                   readings=[1.5, float("-inf")])
+        self.assertTrue(math.isnan(reloaded.latitude))
+        self.assertEqual(reloaded.longitude, float("inf"))
+        self.assertEqual(reloaded.readings, [1.5, float("-inf")])
+
+    def test_save_reload_json(self):
+        """
+        Test a save/reload round trip through the standard library json
+        module used when orjson is not installed.
+
+        """
+        with patch.object(file_storage, "orjson", None):
+            reloaded = self.round_trip(name="Holberton", my_number=10**20)
+        self.assertEqual(reloaded.name, "Holberton")
+        self.assertEqual(reloaded.my_number, 10**20)
+        self.assertIs(type(reloaded.my_number), int)
+
 
 if __name__ == '__main__':
     unittest.main()
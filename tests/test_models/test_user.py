@@ -43,6 +43,12 @@ class TestUser(unittest.TestCase):
         self.assertEqual(self.user.first_name, "John")
         self.assertEqual(self.user.last_name, "Doe")
 
+    def test_str_uses_class_name(self):
+        """
+        Test that the string representation starts with the User class name.
+        """
+        self.assertTrue(str(self.user).startswith(f"[User] ({self.user.id})"))
+
 
 if __name__ == "__main__":
     unittest.main()